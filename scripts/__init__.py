@@ -0,0 +1,7 @@
+"""
+Architecture governance toolkit scripts.
+
+Each module remains runnable on its own (python3 scripts/<name>.py); the
+package form exists so all of them can share one interpreter via
+python -m scripts (see __main__.py).
+"""
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+__main__.py
+
+Single entry point for the toolkit scripts. Only the requested subcommand's
+module is imported, so optional dependencies (e.g. pyyaml) are loaded only by
+the code paths that need them.
+
+Usage:
+  python -m scripts <command> [args...]
+  python -m scripts batch [jobs.jsonl|-]
+  python -m scripts list
+
+Commands:
+  hotspot_merge, scan_drift, ownership_diff, risk_update, parse_trivy,
+  parse_semgrep (Python, run in-process)
+  gen_sbom, adr_new (shell, run via bash)
+  Hyphenated aliases (hotspot-merge, ...) are accepted.
+
+Batch mode:
+  Runs many invocations in one process. Jobs are read one JSON object per line
+  from the given file, or stdin when omitted or "-":
+    {"id": "drift-pr-42", "cmd": "scan_drift", "args": ["--current", "c.json", ...], "env": {"RISK_W_CHURN": "0.5"}}
+  "id" and "env" are optional; "args" must be a list of strings. Script output
+  is redirected to stderr; stdout carries one JSON result per line:
+    {"id": "drift-pr-42", "cmd": "scan_drift", "exit": 2, "seconds": 0.0012}
+  Malformed lines (invalid JSON, non-object, unknown command, bad args) get a
+  result with exit 1 and an "error" message; the remaining jobs still run.
+  Exit code is the highest job exit code (0 when every job succeeded).
+"""
+import sys, os
+
+PY_COMMANDS = [
+    "hotspot_merge",
+    "scan_drift",
+    "ownership_diff",
+    "risk_update",
+    "parse_trivy",
+    "parse_semgrep",
+]
+
+SH_COMMANDS = {
+    "gen_sbom": "gen_sbom.sh",
+    "adr_new": "adr_new.sh",
+}
+
+def resolve(cmd):
+    name = cmd.replace("-", "_")
+    if name.endswith(".py") or name.endswith(".sh"):
+        name = name[:-3]
+    if name in PY_COMMANDS or name in SH_COMMANDS:
+        return name
+    return None
+
+def exit_code(e):
+    if e.code is None: return 0
+    if isinstance(e.code, int): return e.code
+    print(e.code, file=sys.stderr)
+    return 1
+
+def run(name, args, stdout=None):
+    """
+    Run one command in-process and return its exit code. stdout is a file
+    descriptor for shell commands' output (default: inherited).
+    """
+    if name in SH_COMMANDS:
+        import subprocess
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), SH_COMMANDS[name])
+        return subprocess.call(["bash", script] + list(args), stdout=stdout)
+
+    from importlib import import_module
+    module = import_module(f"{__package__ or 'scripts'}.{name}")
+    saved_argv = sys.argv
+    sys.argv = [f"{name}.py"] + list(args)
+    try:
+        module.main(list(args))
+    except SystemExit as e:
+        return exit_code(e)
+    finally:
+        sys.argv = saved_argv
+    return 0
+
+def job_error(job):
+    """Reason a decoded batch job is malformed, or None."""
+    if not isinstance(job, dict):
+        return "job must be a JSON object"
+    if not isinstance(job.get("cmd"), str) or not resolve(job["cmd"]):
+        return f"unknown command {job.get('cmd')!r}"
+    args = job.get("args", [])
+    if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+        return "args must be a list of strings"
+    if not isinstance(job.get("env") or {}, dict):
+        return "env must be a JSON object"
+    return None
+
+def run_batch(path):
+    import json, time
+    from contextlib import redirect_stdout
+
+    stream = sys.stdin if path in (None, "-") else open(path)
+    worst = 0
+    try:
+        for lineno, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line: continue
+            start = time.perf_counter()
+            try:
+                job = json.loads(line)
+                error = job_error(job)
+            except ValueError as e:
+                job, error = None, f"invalid JSON: {e}"
+            if error:
+                print(f"[BATCH] line {lineno}: {error}", file=sys.stderr)
+                valid = isinstance(job, dict)
+                result = {"id": job.get("id", lineno) if valid else lineno,
+                          "cmd": job.get("cmd") if valid else None,
+                          "error": error}
+                code = 1
+            else:
+                job_id = job.get("id", lineno)
+                result = {"id": job_id, "cmd": job["cmd"]}
+                env = {k: str(v) for k, v in (job.get("env") or {}).items()}
+                saved_env = {k: os.environ.get(k) for k in env}
+                os.environ.update(env)
+                try:
+                    # redirect_stdout only covers Python writes; shell jobs
+                    # get fd 2 so nothing but results reaches stdout.
+                    with redirect_stdout(sys.stderr):
+                        code = run(resolve(job["cmd"]), job.get("args", []), stdout=2)
+                except Exception as e:
+                    print(f"[BATCH] {job_id}: {type(e).__name__}: {e}", file=sys.stderr)
+                    code = 1
+                finally:
+                    for k, v in saved_env.items():
+                        if v is None: os.environ.pop(k, None)
+                        else: os.environ[k] = v
+            result["exit"] = code
+            result["seconds"] = round(time.perf_counter() - start, 6)
+            print(json.dumps(result), flush=True)
+            worst = max(worst, code)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return worst
+
+def usage(file=sys.stdout):
+    print(__doc__[__doc__.index("Usage:"):__doc__.index("Batch mode:")].strip(), file=file)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        usage()
+        return 0
+    cmd, args = argv[0], argv[1:]
+    if cmd == "list":
+        for name in PY_COMMANDS + list(SH_COMMANDS):
+            print(name)
+        return 0
+    if cmd == "batch":
+        if len(args) > 1:
+            print("usage: python -m scripts batch [jobs.jsonl|-]", file=sys.stderr)
+            return 2
+        return run_batch(args[0] if args else None)
+    name = resolve(cmd)
+    if not name:
+        print(f"unknown command '{cmd}' (see: python -m scripts list)", file=sys.stderr)
+        return 2
+    return run(name, args)
+
+if __name__ == "__main__":
+    sys.exit(main())
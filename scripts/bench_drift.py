@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+bench_drift.py
+
+Times scan_drift.py in-process on a synthetic graph, comparing the full diff
+(what every run did before fingerprints) with the fingerprinted paths.
+
+Scenarios (median wall time of --repeat runs, including JSON loading):
+  full         load both graphs, diff every node and edge
+  no_change    stamped previous, identical current (header-only previous)
+  one_group    stamped previous, one edge added in one group
+  unstamped    previous without fingerprint, identical current
+
+Inputs:
+  --nodes 50000 --edges 300000 --groups 200
+  --repeat 3
+  --out bench_drift.json (optional)
+
+Output JSON:
+{
+  "meta": {"nodes": 50000, "edges": 300000, "groups": 200, "repeat": 3},
+  "timings_ms": {"full": 1700.0, "no_change": 900.0, "one_group": 1500.0, "unstamped": 1900.0}
+}
+"""
+import argparse, contextlib, io, json, os, random, statistics, sys, tempfile, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def synthetic_graph(n_nodes, n_edges, n_groups, seed=0):
+    rng = random.Random(seed)
+    nodes = [{"id": f"pkg{i % 500}.mod{i}", "group": f"svc{i % n_groups}"} for i in range(n_nodes)]
+    edges = [{"from": nodes[rng.randrange(n_nodes)]["id"], "to": nodes[rng.randrange(n_nodes)]["id"],
+              "type": rng.choice(["import", "call"])} for _ in range(n_edges)]
+    return {"meta": {"ref": "bench"}, "nodes": nodes, "edges": edges}
+
+def write(path, graph):
+    with open(path, "w") as f:
+        f.write(json.dumps(graph))
+
+def median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                fn()
+            except SystemExit:
+                pass
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main(argv=None):
+    sys.path.insert(0, ROOT)
+    from scripts import scan_drift
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--nodes", type=int, default=50000)
+    ap.add_argument("--edges", type=int, default=300000)
+    ap.add_argument("--groups", type=int, default=200)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--out")
+    args = ap.parse_args(argv)
+
+    graph = synthetic_graph(args.nodes, args.edges, args.groups)
+    with tempfile.TemporaryDirectory() as tmp:
+        plain, stamped, changed, report = (os.path.join(tmp, n) for n in
+                                           ("plain.json", "stamped.json", "changed.json", "report.json"))
+        write(plain, graph)
+        write(stamped, graph)
+        run = lambda cur, prev, *extra: scan_drift.main(
+            ["--current", cur, "--previous", prev, "--out", report, *extra])
+        with contextlib.redirect_stdout(io.StringIO()):
+            run(stamped, plain, "--stamp")
+        graph["edges"].append({"from": graph["nodes"][0]["id"], "to": graph["nodes"][1]["id"], "type": "import"})
+        write(changed, graph)
+
+        def full():
+            prev, cur = scan_drift.load(plain), scan_drift.load(plain)
+            scan_drift.diff_graphs(prev, cur, 0.1)
+
+        timings = {
+            "full": median_ms(full, args.repeat),
+            "no_change": median_ms(lambda: run(plain, stamped), args.repeat),
+            "one_group": median_ms(lambda: run(changed, stamped), args.repeat),
+            "unstamped": median_ms(lambda: run(plain, plain), args.repeat),
+        }
+
+    meta = {"nodes": args.nodes, "edges": args.edges, "groups": args.groups, "repeat": args.repeat}
+    timings = {k: round(v, 1) for k, v in timings.items()}
+    print(f"[BENCH] {args.nodes} nodes, {args.edges} edges, {args.groups} groups")
+    for name, ms in timings.items():
+        print(f"{name:<12}{ms:>10} ms")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"meta": meta, "timings_ms": timings}, f, indent=2)
+        print(f"[BENCH] Wrote {len(timings)} timings to {args.out}")
+
+if __name__ == "__main__":
+    main()
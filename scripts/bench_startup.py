@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py
+
+Measures per-invocation startup overhead of the toolkit scripts, which
+dominates when CI bots call them thousands of times on tiny inputs.
+
+Each command is run with --help (argument parsing only, no I/O) in three ways:
+  direct  python3 scripts/<cmd>.py --help          (one process per call)
+  module  python3 -m scripts <cmd> --help          (one process per call)
+  batch   python3 -m scripts batch                  (N jobs vs 1 job, one process)
+plus an interpreter baseline (python3 -c pass).
+
+Inputs:
+  --commands hotspot_merge,scan_drift (default: all Python commands)
+  --repeat 20
+  --out bench_startup.json (optional)
+
+Output JSON:
+{
+  "meta": {"python": "3.12.1", "repeat": 20, "baseline_ms": 11.2},
+  "commands": [
+    {"cmd": "scan_drift", "direct_ms": 24.1, "module_ms": 25.0, "batch_ms": 0.21}
+  ]
+}
+Timings are medians in milliseconds; batch_ms is (T_N - T_1) / (N - 1), where
+T_N and T_1 time batches of N = repeat jobs and of a single job (each a median
+of BATCH_RUNS runs), i.e. the marginal cost of one more job with interpreter
+start and module imports excluded.
+"""
+import argparse, json, os, statistics, subprocess, sys, time
+
+# Batch runs are few and long, so each side of T_N - T_1 is a median of these.
+BATCH_RUNS = 5
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def timed(cmd, stdin=None):
+    start = time.perf_counter()
+    subprocess.run(cmd, cwd=ROOT, input=stdin, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL, check=False)
+    return (time.perf_counter() - start) * 1000
+
+def median_ms(cmd, repeat):
+    return statistics.median(timed(cmd) for _ in range(repeat))
+
+def main(argv=None):
+    sys.path.insert(0, ROOT)
+    from scripts.__main__ import PY_COMMANDS
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--commands", default=",".join(PY_COMMANDS))
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--out")
+    args = ap.parse_args(argv)
+    if args.repeat < 2:
+        ap.error("--repeat must be at least 2")
+
+    py = sys.executable
+    baseline = median_ms([py, "-c", "pass"], args.repeat)
+
+    results = []
+    for cmd in [c.strip() for c in args.commands.split(",") if c.strip()]:
+        direct = median_ms([py, os.path.join("scripts", f"{cmd}.py"), "--help"], args.repeat)
+        module = median_ms([py, "-m", "scripts", cmd, "--help"], args.repeat)
+        job = (json.dumps({"cmd": cmd, "args": ["--help"]}) + "\n").encode()
+        batch_n = statistics.median(timed([py, "-m", "scripts", "batch"], stdin=job * args.repeat)
+                                    for _ in range(BATCH_RUNS))
+        batch_1 = statistics.median(timed([py, "-m", "scripts", "batch"], stdin=job)
+                                    for _ in range(BATCH_RUNS))
+        results.append({
+            "cmd": cmd,
+            "direct_ms": round(direct, 2),
+            "module_ms": round(module, 2),
+            "batch_ms": round(max(batch_n - batch_1, 0) / (args.repeat - 1), 2)
+        })
+
+    meta = {
+        "python": ".".join(map(str, sys.version_info[:3])),
+        "repeat": args.repeat,
+        "baseline_ms": round(baseline, 2)
+    }
+
+    print(f"[BENCH] interpreter baseline {meta['baseline_ms']} ms")
+    print(f"{'command':<16}{'direct':>10}{'module':>10}{'batch':>10}")
+    for r in results:
+        print(f"{r['cmd']:<16}{r['direct_ms']:>10}{r['module_ms']:>10}{r['batch_ms']:>10}")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"meta": meta, "commands": results}, f, indent=2)
+        print(f"[BENCH] Wrote {len(results)} entries to {args.out}")
+
+if __name__ == "__main__":
+    main()
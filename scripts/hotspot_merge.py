@@ -22,14 +22,38 @@ Where:
 
 Override with env vars:
   RISK_W_CHURN, RISK_W_COMPLEXITY, RISK_W_COVERAGE, RISK_W_CRITICALITY
+
+Windowed mode (--windowed):
+  Walks git history once (or reads a pre-collected --log) and builds a per-file
+  churn histogram over fixed-width time buckets. Churn for every sliding window
+  is derived from per-file prefix sums, and an exponentially time-decayed churn
+  is kept alongside, so a full year of weekly rankings costs one history pass.
+
+  One window is emitted per bucket over the last --since days, ending at --end.
+  History is read further back (window width, or until decay weights fall below
+  1%, whichever is longer) so every emitted window covers its full width and
+  decayed churn is warmed up.
+
+  --since 365 --bucket-days 7 --window-days 90 --half-life-days 30
+  --end 2025-01-07 (optional: epoch seconds or ISO date/time in UTC; default now)
+  --log history.txt (optional: output of git log --name-only --pretty=format:@%ct)
+  --rank-by window|decayed
+  --timeseries-dir artifacts/timeseries (writes hotspots_windows.json)
+
+  Output (compact, file paths interned by index):
+  {
+    "meta": {...},
+    "files": ["src/a.py", ...],
+    "windows": [
+      {"end": "2025-01-07T00:00:00Z", "top": [[file_idx, risk_score, churn, decayed_churn], ...]}
+    ]
+  }
 """
-import argparse, json, sys, os, math
+import argparse, json, sys, os, math, time
 from collections import defaultdict
 
-try:
-    import yaml
-except:
-    yaml = None
+# Decayed churn ignores history whose weight has fallen below this fraction.
+DECAY_EPSILON = 0.01
 
 def load_churn(path):
     churn = {}
@@ -70,30 +94,81 @@ def load_coverage(path):
     return data
 
 def load_criticality(path):
-    if not yaml:
+    # Imported lazily: only needed when a criticality file is passed.
+    try:
+        import yaml
+    except ImportError:
         raise RuntimeError("pyyaml required for criticality YAML")
     with open(path) as f:
         return yaml.safe_load(f) or {}
 
-def main():
-    ap=argparse.ArgumentParser()
-    ap.add_argument("--churn", required=True)
-    ap.add_argument("--complexity", required=True)
-    ap.add_argument("--coverage")
-    ap.add_argument("--criticality")
-    ap.add_argument("--out", required=True)
-    ap.add_argument("--top", type=int, default=50)
-    args=ap.parse_args()
+def load_history(path):
+    with open(path) as f:
+        return f.read().splitlines()
 
-    churn=load_churn(args.churn)
-    complexity=load_complexity(args.complexity)
-    coverage=load_coverage(args.coverage) if args.coverage else {}
-    criticality=load_criticality(args.criticality) if args.criticality else {}
+def git_history_between(start, end):
+    import subprocess
+    cmd = ["git", "log", f"--since=@{start}", f"--until=@{end}", "--name-only", "--pretty=format:@%ct"]
+    return subprocess.check_output(cmd).decode().splitlines()
 
-    max_churn=max(churn.values()) if churn else 1
-    max_cc=max(complexity.values()) if complexity else 1
-    max_crit=max(criticality.values()) if criticality else 1
+def parse_end(value):
+    """Epoch seconds or ISO 'YYYY-MM-DD[THH:MM:SS[Z]]' (UTC) -> epoch seconds."""
+    if value is None:
+        return int(time.time())
+    if value.isdigit():
+        return int(value)
+    import calendar
+    for fmt in ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+        try:
+            return calendar.timegm(time.strptime(value, fmt))
+        except ValueError:
+            pass
+    raise ValueError(f"unrecognized --end value: {value}")
 
+def parse_history(lines):
+    """
+    Parse 'git log --name-only --pretty=format:@%ct' output.
+    Returns list of (commit_timestamp, filepath).
+    """
+    events=[]
+    ts=None
+    for line in lines:
+        line=line.strip()
+        if not line: continue
+        if line.startswith("@") and line[1:].isdigit():
+            ts=int(line[1:])
+        elif ts is not None:
+            events.append((ts, line))
+    return events
+
+def bucket_histograms(events, end, bucket_secs, n_buckets):
+    """
+    Returns mapping file->[count per bucket], oldest bucket first.
+    The last bucket ends at `end`; events outside the span are dropped.
+    """
+    hist=defaultdict(lambda: [0]*n_buckets)
+    for ts, file in events:
+        age=(end - ts)//bucket_secs
+        if age < 0 or age >= n_buckets:
+            continue
+        hist[file][n_buckets-1-age]+=1
+    return hist
+
+def prefix_sums(counts):
+    out=[0]*(len(counts)+1)
+    for i, c in enumerate(counts):
+        out[i+1]=out[i]+c
+    return out
+
+def decayed_series(counts, alpha):
+    out=[]
+    acc=0.0
+    for c in counts:
+        acc=acc*alpha + c
+        out.append(acc)
+    return out
+
+def load_weights():
     w_churn=float(os.getenv("RISK_W_CHURN","0.4"))
     w_complexity=float(os.getenv("RISK_W_COMPLEXITY","0.4"))
     w_coverage=float(os.getenv("RISK_W_COVERAGE","0.1"))
@@ -101,6 +176,14 @@ def main():
     total = w_churn + w_complexity + w_coverage + w_crit
     if not math.isclose(total,1.0):
         w_churn/=total; w_complexity/=total; w_coverage/=total; w_crit/=total
+    return w_churn, w_complexity, w_coverage, w_crit
+
+def score_records(churn, complexity, coverage, criticality, weights):
+    w_churn, w_complexity, w_coverage, w_crit = weights
+
+    max_churn=max(churn.values()) if churn else 1
+    max_cc=max(complexity.values()) if complexity else 1
+    max_crit=max(criticality.values()) if criticality else 1
 
     files=set(churn)|set(complexity)|set(coverage)|set(criticality)
     records=[]
@@ -136,7 +219,127 @@ def main():
         })
 
     records.sort(key=lambda r: r["risk_score"], reverse=True)
-    top=records[:args.top]
+    return records
+
+def warmup_buckets(width, alpha):
+    """Buckets of history needed before the first emitted window."""
+    decay=math.ceil(math.log(DECAY_EPSILON)/math.log(alpha)) if alpha < 1 else 0
+    return max(width-1, decay)
+
+def run_windowed(args, complexity, coverage, criticality, weights, end):
+    bucket_secs=args.bucket_days*86400
+    n_windows=max(1, math.ceil(args.since/args.bucket_days))
+    width=max(1, math.ceil(args.window_days/args.bucket_days))
+    alpha=0.5**(args.bucket_days/args.half_life_days)
+    warmup=warmup_buckets(width, alpha)
+    n_buckets=n_windows + warmup
+
+    if args.log:
+        events=parse_history(load_history(args.log))
+    else:
+        events=parse_history(git_history_between(end - n_buckets*bucket_secs, end))
+
+    hist=bucket_histograms(events, end, bucket_secs, n_buckets)
+    prefix={f: prefix_sums(c) for f, c in hist.items()}
+    decayed={f: decayed_series(c, alpha) for f, c in hist.items()}
+
+    files=[]
+    index={}
+    windows=[]
+    for b in range(warmup, n_buckets):
+        lo=b+1-width
+        window_churn={}
+        for f, p in prefix.items():
+            c=p[b+1]-p[lo]
+            if c: window_churn[f]=c
+        if args.rank_by=="decayed":
+            rank_churn={f: d[b] for f, d in decayed.items() if d[b] > 0}
+        else:
+            rank_churn=window_churn
+
+        top=[]
+        for r in score_records(rank_churn, complexity, coverage, criticality, weights)[:args.top]:
+            f=r["file"]
+            if f not in index:
+                index[f]=len(files)
+                files.append(f)
+            dc=decayed[f][b] if f in decayed else 0.0
+            top.append([index[f], r["risk_score"], window_churn.get(f,0), round(dc,3)])
+
+        window_end=end - (n_buckets-1-b)*bucket_secs
+        windows.append({
+            "end": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(window_end)),
+            "top": top
+        })
+
+    w_churn, w_complexity, w_coverage, w_crit = weights
+    out=args.out or os.path.join(args.timeseries_dir, "hotspots_windows.json")
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    with open(out,"w") as f:
+        json.dump({
+            "meta":{
+                "weights":{
+                    "churn":w_churn,
+                    "complexity":w_complexity,
+                    "coverage":w_coverage,
+                    "criticality":w_crit
+                },
+                "end":time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(end)),
+                "since_days":args.since,
+                "history_days":n_buckets*args.bucket_days,
+                "bucket_days":args.bucket_days,
+                "window_days":args.window_days,
+                "half_life_days":args.half_life_days,
+                "rank_by":args.rank_by,
+                "columns":["file","risk_score","churn","decayed_churn"]
+            },
+            "files": files,
+            "windows": windows
+        }, f, separators=(",",":"))
+
+    print(f"[HOTSPOTS] Wrote {len(windows)} windows ({len(files)} files) to {out}")
+
+def main(argv=None):
+    ap=argparse.ArgumentParser()
+    ap.add_argument("--churn")
+    ap.add_argument("--complexity", required=True)
+    ap.add_argument("--coverage")
+    ap.add_argument("--criticality")
+    ap.add_argument("--out")
+    ap.add_argument("--top", type=int, default=50)
+    ap.add_argument("--windowed", action="store_true")
+    ap.add_argument("--log")
+    ap.add_argument("--since", type=int, default=365)
+    ap.add_argument("--end")
+    ap.add_argument("--bucket-days", type=int, default=7)
+    ap.add_argument("--window-days", type=int, default=90)
+    ap.add_argument("--half-life-days", type=float, default=30.0)
+    ap.add_argument("--rank-by", choices=["window","decayed"], default="window")
+    ap.add_argument("--timeseries-dir", default="artifacts/timeseries")
+    args=ap.parse_args(argv)
+
+    if not args.windowed and not (args.churn and args.out):
+        ap.error("--churn and --out are required unless --windowed is set")
+    if args.bucket_days <= 0 or args.half_life_days <= 0:
+        ap.error("--bucket-days and --half-life-days must be positive")
+
+    try:
+        end=parse_end(args.end)
+    except ValueError as e:
+        ap.error(str(e))
+
+    complexity=load_complexity(args.complexity)
+    coverage=load_coverage(args.coverage) if args.coverage else {}
+    criticality=load_criticality(args.criticality) if args.criticality else {}
+    weights=load_weights()
+
+    if args.windowed:
+        run_windowed(args, complexity, coverage, criticality, weights, end)
+        return
+
+    churn=load_churn(args.churn)
+    w_churn, w_complexity, w_coverage, w_crit = weights
+    top=score_records(churn, complexity, coverage, criticality, weights)[:args.top]
 
     with open(args.out,"w") as f:
         json.dump({
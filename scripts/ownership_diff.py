@@ -31,11 +31,6 @@ import subprocess, argparse, json, os
 from collections import defaultdict, Counter
 from pathlib import Path
 
-try:
-    import yaml
-except:
-    yaml = None
-
 def git_files_since(days):
     cmd = ["bash","-lc", f'git log --since={days}.days --name-only --pretty=format:"%ae"']
     out = subprocess.check_output(cmd).decode().splitlines()
@@ -58,18 +53,23 @@ def bucket_by_directory(entries, depth):
     return dir_author
 
 def load_criticality(path):
-    if not path or not yaml: return {}
+    if not path: return {}
+    # Imported lazily: only needed when a criticality file is passed.
+    try:
+        import yaml
+    except ImportError:
+        return {}
     with open(path) as f:
         return yaml.safe_load(f) or {}
 
-def main():
+def main(argv=None):
     ap=argparse.ArgumentParser()
     ap.add_argument("--days", type=int, default=90)
     ap.add_argument("--depth", type=int, default=2)
     ap.add_argument("--threshold", type=float, default=0.6)
     ap.add_argument("--criticality")
     ap.add_argument("--out", required=True)
-    args=ap.parse_args()
+    args=ap.parse_args(argv)
 
     raw=git_files_since(args.days)
     dir_author=bucket_by_directory(raw, args.depth)
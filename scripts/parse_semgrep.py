@@ -46,11 +46,11 @@ MAP = {
     "INFO": "LOW"
 }
 
-def main():
+def main(argv=None):
     ap = argparse.ArgumentParser()
     ap.add_argument("--input", required=True)
     ap.add_argument("--out", required=True)
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     try:
         data = json.load(open(args.input))
@@ -26,11 +26,11 @@ import json, argparse, sys
 
 SEV_ORDER = ["CRITICAL","HIGH","MEDIUM","LOW","UNKNOWN"]
 
-def main():
+def main(argv=None):
     ap = argparse.ArgumentParser()
     ap.add_argument("--input", required=True)
     ap.add_argument("--out", required=True)
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     try:
         with open(args.input) as f:
@@ -43,14 +43,14 @@ def hotspot_sev(score):
     if score >= 0.5: return "MEDIUM"
     return "LOW"
 
-def main():
+def main(argv=None):
     ap=argparse.ArgumentParser()
     ap.add_argument("--hotspots")
     ap.add_argument("--drift")
     ap.add_argument("--ownership")
     ap.add_argument("--security")
     ap.add_argument("--out", required=True)
-    args=ap.parse_args()
+    args=ap.parse_args(argv)
 
     hotspots = load(args.hotspots)
     drift = load(args.drift)
@@ -41,41 +41,188 @@ Outputs JSON:
   "core_boundary_flags": [...]
 }
 
+Fingerprints (Merkle-style):
+  Each snapshot may carry a "fingerprint" block:
+  {
+    "fingerprint": {
+      "version": 1,
+      "root": "<sha256 over sorted group hashes>",
+      "groups": {"serviceX": {"hash":"<sha256>", "nodes":12, "edges":40}, ...}
+    }
+  }
+  A group hash covers the ids of the group's nodes and the edges whose source
+  node belongs to the group (edges from unknown nodes fall into group "").
+  The current graph is always hashed in one pass whose per-group sets are kept
+  for the diff. --stamp writes "fingerprint" and "meta" ahead of the graph, so
+  a stamped previous is read from that header alone: when the roots match its
+  nodes and edges are never parsed. Otherwise only groups whose hash changed
+  are compared (the stamped previous is then parsed and scanned once).
+
+  --stamp    write the computed fingerprint back into --current so it can
+             serve as the next run's --previous
+  --rehash   ignore the fingerprint embedded in --previous and recompute it
+             (the --current fingerprint is always recomputed)
+
 Exit code:
   0 if below threshold
   2 if drift >= threshold (trigger pipeline action)
 
 """
-import json, argparse, sys, hashlib
+import json, argparse, sys, hashlib, operator
 from collections import defaultdict
+from itertools import islice
 
 def load(path):
     with open(path) as f:
         return json.load(f)
 
+HEADER_KEYS = ("fingerprint", "meta")
+
+def read_header(text):
+    """
+    Decode the leading "fingerprint" and "meta" keys of a stamped snapshot
+    without parsing its nodes and edges. Returns None unless both come first.
+    """
+    decoder = json.JSONDecoder()
+    header = {}
+    pos = 0
+    try:
+        pos = skip_ws(text, pos)
+        if text[pos] != "{":
+            return None
+        pos += 1
+        while len(header) < len(HEADER_KEYS):
+            key, pos = decoder.raw_decode(text, skip_ws(text, pos))
+            if key not in HEADER_KEYS:
+                return None
+            pos = skip_ws(text, pos)
+            if text[pos] != ":":
+                return None
+            header[key], pos = decoder.raw_decode(text, skip_ws(text, pos + 1))
+            pos = skip_ws(text, pos)
+            if text[pos] != ",":
+                break
+            pos += 1
+    except (ValueError, IndexError):
+        return None
+    return header if len(header) == len(HEADER_KEYS) else None
+
+def skip_ws(text, pos):
+    while text[pos] in " \t\r\n":
+        pos += 1
+    return pos
+
 def edge_key(e):
     return (e["from"], e["to"], e.get("type",""))
 
-def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--current", required=True)
-    ap.add_argument("--previous", required=True)
-    ap.add_argument("--threshold", type=float, default=0.1)
-    ap.add_argument("--out", required=True)
-    ap.add_argument("--mode", choices=["deps","services"], default="deps")
-    args = ap.parse_args()
+FINGERPRINT_VERSION = 2
 
-    cur = load(args.current)
-    prev = load(args.previous)
+def node_group(n):
+    g = n.get("group")
+    return "" if g is None else str(g)
+
+def node_owners(graph):
+    """Mapping node id->group; a repeated id belongs to its last entry."""
+    return {n["id"]: node_group(n) for n in graph.get("nodes", [])}
+
+def split_groups(graph):
+    """
+    Returns mapping group->(list of node ids, list of edge keys) in one pass.
+    Edges are owned by the group of their source node. Edge keys may repeat;
+    they are deduplicated when hashed and when turned into sets.
+    """
+    owner = node_owners(graph)
+    groups = {}
+    for node_id, g in owner.items():
+        if g not in groups:
+            groups[g] = ([], [])
+        groups[g][0].append(node_id)
+    get = owner.get
+    for e in graph.get("edges", []):
+        src = e["from"]
+        g = get(src, "")
+        if g not in groups:
+            groups[g] = ([], [])
+        groups[g][1].append((src, e["to"], e.get("type","")))
+    return groups
+
+def canonical(items, fields):
+    """
+    Canonical bytes and distinct count for ids (fields=1) or edge keys (fields=3).
+    Plain strings are sorted, deduplicated and joined with NUL/newline
+    separators; the separator counts prove no value contained one. Anything
+    else (ints, null edge types, embedded separators) falls back to repr of a
+    repr-sorted list.
+    """
+    try:
+        lines = sorted(items if fields == 1 else map("\0".join, items))
+        # Duplicates are adjacent once sorted; only pay for dedup when present.
+        if any(map(operator.eq, lines, islice(lines, 1, None))):
+            lines = list(dict.fromkeys(lines))
+        blob = "\n".join(lines)
+        if (blob.count("\n") == max(len(lines)-1, 0)
+                and blob.count("\0") == (fields-1)*len(lines)):
+            return b"s" + blob.encode(), len(lines)
+    except TypeError:
+        pass
+    unique = sorted(set(items), key=repr)
+    return b"r" + repr(unique).encode(), len(unique)
+
+def fingerprint_groups(groups):
+    fp_groups = {}
+    for g, (nodes, edges) in groups.items():
+        node_bytes, node_count = canonical(nodes, 1)
+        edge_bytes, edge_count = canonical(edges, 3)
+        h = hashlib.sha256(node_bytes)
+        h.update(b"\1")
+        h.update(edge_bytes)
+        fp_groups[g] = {"hash": h.hexdigest(), "nodes": node_count, "edges": edge_count}
+    root = hashlib.sha256()
+    for g in sorted(fp_groups):
+        root.update(f"{g}\0{fp_groups[g]['hash']}\n".encode())
+    return {"version": FINGERPRINT_VERSION, "root": root.hexdigest(), "groups": fp_groups}
+
+def fingerprint(graph):
+    return fingerprint_groups(split_groups(graph))
 
-    prev_nodes = {n["id"]: n for n in prev.get("nodes", [])}
-    cur_nodes = {n["id"]: n for n in cur.get("nodes", [])}
+def changed_groups(prev_fp, cur_fp):
+    prev_g, cur_g = prev_fp["groups"], cur_fp["groups"]
+    return sorted(g for g in set(prev_g) | set(cur_g)
+                  if prev_g.get(g, {}).get("hash") != cur_g.get(g, {}).get("hash"))
 
-    added_nodes = sorted(set(cur_nodes) - set(prev_nodes))
-    removed_nodes = sorted(set(prev_nodes) - set(cur_nodes))
+def group_sets(groups, wanted):
+    """Union of the node ids and edge keys of the wanted groups."""
+    nodes, edges = set(), set()
+    for g in wanted:
+        if g in groups:
+            nodes.update(groups[g][0])
+            edges.update(groups[g][1])
+    return nodes, edges
 
-    prev_edges_set = set(edge_key(e) for e in prev.get("edges", []))
-    cur_edges_set = set(edge_key(e) for e in cur.get("edges", []))
+def subgraph_sets(graph, groups=None):
+    """Node ids and edge keys belonging to the given groups (all when None)."""
+    if groups is not None and not groups:
+        return set(), set()
+    wanted = None if groups is None else set(groups)
+    owner = node_owners(graph)
+    nodes = {i for i, g in owner.items() if wanted is None or g in wanted}
+    edges = set()
+    for e in graph.get("edges", []):
+        if wanted is None or owner.get(e["from"], "") in wanted:
+            edges.add(edge_key(e))
+    return nodes, edges
+
+def diff_graphs(prev, cur, threshold, prev_sets=None, cur_sets=None, prev_edge_count=None):
+    """
+    Diff two graphs. Without prev_sets/cur_sets the whole graphs are compared;
+    when (node ids, edge keys) subsets are given only those are compared and
+    prev_edge_count must be the previous graph's total edge count.
+    """
+    prev_nodes, prev_edges_set = prev_sets if prev_sets is not None else subgraph_sets(prev)
+    cur_nodes, cur_edges_set = cur_sets if cur_sets is not None else subgraph_sets(cur)
+
+    added_nodes = sorted(cur_nodes - prev_nodes)
+    removed_nodes = sorted(prev_nodes - cur_nodes)
 
     added_edges_raw = cur_edges_set - prev_edges_set
     removed_edges_raw = prev_edges_set - cur_edges_set
@@ -83,19 +230,23 @@ def main():
     added_edges = [ {"from":f,"to":t,"type":typ} for (f,t,typ) in added_edges_raw ]
     removed_edges = [ {"from":f,"to":t,"type":typ} for (f,t,typ) in removed_edges_raw ]
 
-    prev_edge_count = len(prev_edges_set) or 1
-    churn_ratio = (len(added_edges_raw)+len(removed_edges_raw))/prev_edge_count
-
-    # Degree calculations on previous graph
-    in_deg_prev = defaultdict(int)
-    for f,t,typ in prev_edges_set:
-        in_deg_prev[t]+=1
+    if prev_edge_count is None:
+        prev_edge_count = len(prev_edges_set)
+    churn_ratio = (len(added_edges_raw)+len(removed_edges_raw))/(prev_edge_count or 1)
 
+    # Degree calculations on previous graph, restricted to targets of new edges
     core_boundary_flags = []
-    for e in added_edges:
-        target = e["to"]
-        if in_deg_prev.get(target,0)==0 and target in prev_nodes:
-            core_boundary_flags.append(e)
+    if added_edges:
+        targets = {e["to"] for e in added_edges}
+        prev_targets = {n["id"] for n in prev.get("nodes", []) if n["id"] in targets}
+        in_deg_prev = defaultdict(int)
+        for e in prev.get("edges", []):
+            if e["to"] in targets:
+                in_deg_prev[e["to"]]+=1
+        for e in added_edges:
+            target = e["to"]
+            if in_deg_prev.get(target,0)==0 and target in prev_targets:
+                core_boundary_flags.append(e)
 
     summary = {
         "previous_ref": prev.get("meta",{}).get("ref"),
@@ -105,19 +256,75 @@ def main():
         "added_edges_count": len(added_edges),
         "removed_edges_count": len(removed_edges),
         "churn_ratio": round(churn_ratio,4),
-        "threshold": args.threshold,
-        "breach": churn_ratio >= args.threshold
+        "threshold": threshold,
+        "breach": churn_ratio >= threshold
     }
 
-    report = {
+    return {
         "summary": summary,
         "added_nodes": added_nodes,
         "removed_nodes": removed_nodes,
         "added_edges": added_edges,
         "removed_edges": removed_edges,
-        "core_boundary_flags": core_boundary_flags,
-        "hash": hashlib.sha256(json.dumps(summary, sort_keys=True).encode()).hexdigest()
+        "core_boundary_flags": core_boundary_flags
+    }
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--current", required=True)
+    ap.add_argument("--previous", required=True)
+    ap.add_argument("--threshold", type=float, default=0.1)
+    ap.add_argument("--out", required=True)
+    ap.add_argument("--mode", choices=["deps","services"], default="deps")
+    ap.add_argument("--stamp", action="store_true")
+    ap.add_argument("--rehash", action="store_true")
+    args = ap.parse_args(argv)
+
+    cur = load(args.current)
+    with open(args.previous) as f:
+        prev_text = f.read()
+
+    # The current graph is always rehashed so a stale embedded stamp cannot
+    # hide drift; only the previous snapshot's fingerprint is trusted. The
+    # per-group sets built while hashing are kept for the diff below.
+    cur_index = split_groups(cur)
+    cur_fp = fingerprint_groups(cur_index)
+
+    # A stamped previous is decoded from its header alone; its graph is only
+    # parsed when some group changed.
+    header = None if args.rehash else read_header(prev_text)
+    prev_fp = header["fingerprint"] if header else None
+    prev = {"meta": header["meta"]} if header else None
+    prev_index = None
+    if not isinstance(prev_fp, dict) or prev_fp.get("version") != FINGERPRINT_VERSION:
+        prev = json.loads(prev_text)
+        prev_index = split_groups(prev)
+        prev_fp = fingerprint_groups(prev_index)
+
+    if args.stamp:
+        stamped = {"fingerprint": cur_fp, "meta": cur.get("meta", {})}
+        stamped.update((k, v) for k, v in cur.items() if k not in stamped)
+        # dumps() encodes in one C call; dump() streams many small writes.
+        with open(args.current,"w") as f:
+            f.write(json.dumps(stamped))
+
+    # Only subgraphs whose hash changed can contribute to the diff;
+    # a matching root means nothing changed at all.
+    changed = changed_groups(prev_fp, cur_fp) if prev_fp["root"] != cur_fp["root"] else []
+    prev_edge_count = sum(g["edges"] for g in prev_fp["groups"].values())
+
+    if changed and prev_index is None:
+        prev = json.loads(prev_text)
+    cur_sets = group_sets(cur_index, changed)
+    prev_sets = group_sets(prev_index, changed) if prev_index is not None else subgraph_sets(prev, changed)
+    report = diff_graphs(prev, cur, args.threshold, prev_sets, cur_sets, prev_edge_count)
+    summary = report["summary"]
+    report["fingerprint"] = {
+        "previous_root": prev_fp["root"],
+        "current_root": cur_fp["root"],
+        "changed_groups": changed
     }
+    report["hash"] = hashlib.sha256(json.dumps(summary, sort_keys=True).encode()).hexdigest()
 
     with open(args.out,"w") as f:
         json.dump(report,f,indent=2)
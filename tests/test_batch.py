@@ -0,0 +1,78 @@
+import io
+import json
+import os
+import shutil
+
+from scripts import __main__ as cli
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_batch(monkeypatch, capfd, lines):
+    # capfd (not capsys) so output written to fd 1 by child processes is seen too.
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(lines) + "\n"))
+    code = cli.main(["batch"])
+    results = [json.loads(l) for l in capfd.readouterr().out.splitlines()]
+    return code, results
+
+
+def test_batch_reports_malformed_jobs_and_keeps_going(monkeypatch, capfd, tmp_path):
+    out = tmp_path / "risk.json"
+    code, results = run_batch(monkeypatch, capfd, [
+        "[1, 2]",
+        "not json",
+        json.dumps({"cmd": "nope"}),
+        json.dumps({"cmd": "risk_update", "args": "--out x"}),
+        json.dumps({"id": "ok", "cmd": "risk-update", "args": ["--out", str(out)]}),
+    ])
+    assert code == 1
+    assert [r["exit"] for r in results] == [1, 1, 1, 1, 0]
+    assert all("error" in r for r in results[:4])
+    assert results[4]["id"] == "ok"
+    assert json.loads(out.read_text())["derived_risks"] == []
+
+
+def test_batch_propagates_exit_codes(monkeypatch, capfd, tmp_path):
+    graph = tmp_path / "g.json"
+    graph.write_text(json.dumps({"nodes": [], "edges": []}))
+    code, results = run_batch(monkeypatch, capfd, [
+        json.dumps({"cmd": "scan_drift",
+                    "args": ["--current", str(graph), "--previous", str(graph),
+                             "--out", str(tmp_path / "d.json"), "--threshold", "0"]}),
+        json.dumps({"cmd": "scan_drift", "args": ["--bogus"]}),
+    ])
+    assert [r["exit"] for r in results] == [2, 2]
+    assert code == 2
+
+
+def test_batch_env_reaches_job_and_is_restored(monkeypatch, capfd, tmp_path):
+    for var in ("RISK_W_CHURN", "RISK_W_COMPLEXITY", "RISK_W_COVERAGE", "RISK_W_CRITICALITY"):
+        monkeypatch.delenv(var, raising=False)
+    churn, cc = tmp_path / "churn.txt", tmp_path / "cc.json"
+    churn.write_text("3 a.py\n")
+    cc.write_text('{"a.py": [{"complexity": 2}]}')
+    job = lambda out, **extra: json.dumps({"cmd": "hotspot_merge", **extra, "args": [
+        "--churn", str(churn), "--complexity", str(cc), "--out", str(tmp_path / out)]})
+    env = {"RISK_W_CHURN": "0.7", "RISK_W_COMPLEXITY": "0.1",
+           "RISK_W_COVERAGE": "0.1", "RISK_W_CRITICALITY": "0.1"}
+    code, results = run_batch(monkeypatch, capfd, [job("with_env.json", env=env), job("default.json")])
+    assert code == 0 and [r["exit"] for r in results] == [0, 0]
+
+    weights = lambda out: json.loads((tmp_path / out).read_text())["meta"]["weights"]
+    assert weights("with_env.json") == {"churn": 0.7, "complexity": 0.1, "coverage": 0.1, "criticality": 0.1}
+    assert weights("default.json") == {"churn": 0.4, "complexity": 0.4, "coverage": 0.1, "criticality": 0.1}
+    assert "RISK_W_CHURN" not in os.environ
+
+
+def test_batch_shell_job_output_stays_off_stdout(monkeypatch, capfd, tmp_path):
+    (tmp_path / "docs" / "adr").mkdir(parents=True)
+    shutil.copy(os.path.join(REPO, "docs", "adr", "ADR_TEMPLATE.md"), tmp_path / "docs" / "adr")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps({"cmd": "adr_new", "args": ["Test thing"]}) + "\n"))
+    code = cli.main(["batch"])
+    captured = capfd.readouterr()
+
+    results = [json.loads(l) for l in captured.out.splitlines()]
+    assert code == 0 and [r["exit"] for r in results] == [0]
+    assert "Created ADR: docs/adr/0001-test-thing.md" in captured.err
+    assert (tmp_path / "docs" / "adr" / "0001-test-thing.md").exists()
@@ -0,0 +1,59 @@
+import json
+
+from scripts import hotspot_merge
+
+DAY = 86400
+END = 1735689600  # 2025-01-01T00:00:00Z
+
+
+def write_constant_log(path, days, end=END):
+    """One change to a.py per day, the latest exactly at `end`."""
+    lines = []
+    for d in range(days):
+        lines += [f"@{end - d*DAY}", "a.py", ""]
+    path.write_text("\n".join(lines))
+
+
+def run_windowed(tmp_path, *extra):
+    log = tmp_path / "log.txt"
+    cc = tmp_path / "cc.json"
+    out = tmp_path / "windows.json"
+    if not log.exists():
+        write_constant_log(log, 2000)
+    cc.write_text('{"a.py": [{"complexity": 4}]}')
+    hotspot_merge.main([
+        "--windowed", "--log", str(log), "--complexity", str(cc), "--out", str(out),
+        "--end", str(END), *extra,
+    ])
+    return json.loads(out.read_text())
+
+
+def test_prefix_sums_and_decay():
+    assert hotspot_merge.prefix_sums([1, 0, 2]) == [0, 1, 1, 3]
+    assert hotspot_merge.decayed_series([1, 0, 2], 0.5) == [1.0, 0.5, 2.25]
+
+
+def test_windows_cover_full_width_on_constant_rate(tmp_path):
+    data = run_windowed(tmp_path, "--since", "365", "--bucket-days", "7", "--window-days", "91")
+    assert len(data["windows"]) == 53
+    assert [w["top"][0][2] for w in data["windows"]] == [91] * 53
+
+
+def test_decayed_churn_is_warmed_up(tmp_path):
+    data = run_windowed(tmp_path, "--since", "365", "--bucket-days", "7", "--half-life-days", "30")
+    alpha = 0.5 ** (7 / 30)
+    steady = 7 / (1 - alpha)
+    for w in data["windows"]:
+        assert abs(w["top"][0][3] - steady) / steady < hotspot_merge.DECAY_EPSILON
+
+
+def test_end_anchors_windows_and_is_recorded(tmp_path):
+    data = run_windowed(tmp_path, "--since", "14", "--bucket-days", "7")
+    assert data["meta"]["end"] == "2025-01-01T00:00:00Z"
+    assert [w["end"] for w in data["windows"]] == ["2024-12-25T00:00:00Z", "2025-01-01T00:00:00Z"]
+
+
+def test_parse_end_formats():
+    assert hotspot_merge.parse_end(str(END)) == END
+    assert hotspot_merge.parse_end("2025-01-01") == END
+    assert hotspot_merge.parse_end("2025-01-01T00:00:00Z") == END
@@ -0,0 +1,150 @@
+import copy
+import json
+import random
+
+import pytest
+
+from scripts import scan_drift
+
+
+def random_graph(rng, n_nodes=40, n_edges=80):
+    nodes = []
+    for i in range(n_nodes):
+        node = {"id": f"m{i}"}
+        if i % 7:
+            node["group"] = f"s{i % 5}"
+        nodes.append(node)
+    edges = [{"from": f"m{rng.randrange(n_nodes + 5)}", "to": f"m{rng.randrange(n_nodes + 5)}",
+              "type": rng.choice(["import", "call"])} for _ in range(n_edges)]
+    return {"nodes": nodes, "edges": edges, "meta": {"ref": "prev"}}
+
+
+def mutate(rng, graph):
+    cur = copy.deepcopy(graph)
+    cur["meta"]["ref"] = "cur"
+    for _ in range(rng.randint(0, 4)):
+        cur["edges"].append({"from": f"m{rng.randrange(45)}", "to": f"m{rng.randrange(50)}", "type": "import"})
+    if cur["edges"] and rng.random() < 0.5:
+        cur["edges"].pop(rng.randrange(len(cur["edges"])))
+    if rng.random() < 0.3:
+        cur["nodes"].append({"id": f"m{rng.randrange(60)}", "group": f"s{rng.randrange(7)}"})
+    if rng.random() < 0.3:
+        cur["nodes"].pop(rng.randrange(len(cur["nodes"])))
+    if rng.random() < 0.3:
+        rng.choice(cur["nodes"])["group"] = "moved"
+    return cur
+
+
+def restricted_diff(prev, cur, threshold=0.1):
+    prev_index, cur_index = scan_drift.split_groups(prev), scan_drift.split_groups(cur)
+    prev_fp, cur_fp = scan_drift.fingerprint_groups(prev_index), scan_drift.fingerprint_groups(cur_index)
+    changed = scan_drift.changed_groups(prev_fp, cur_fp) if prev_fp["root"] != cur_fp["root"] else []
+    prev_edge_count = sum(g["edges"] for g in prev_fp["groups"].values())
+    # Exercise both sources of previous sets: the hashing index and a stamped-snapshot scan.
+    indexed = scan_drift.diff_graphs(prev, cur, threshold, scan_drift.group_sets(prev_index, changed),
+                                     scan_drift.group_sets(cur_index, changed), prev_edge_count)
+    scanned = scan_drift.diff_graphs(prev, cur, threshold, scan_drift.subgraph_sets(prev, changed),
+                                     scan_drift.group_sets(cur_index, changed), prev_edge_count)
+    assert normalized(indexed) == normalized(scanned)
+    return indexed
+
+
+def normalized(report):
+    out = dict(report)
+    for key in ("added_edges", "removed_edges", "core_boundary_flags"):
+        out[key] = sorted(json.dumps(e, sort_keys=True) for e in report[key])
+    return out
+
+
+def test_group_restricted_diff_matches_full_diff():
+    rng = random.Random(27)
+    for _ in range(200):
+        prev = random_graph(rng)
+        cur = mutate(rng, prev)
+        full = scan_drift.diff_graphs(prev, cur, 0.1)
+        assert normalized(restricted_diff(prev, cur)) == normalized(full)
+
+
+def test_duplicate_ids_resolve_to_last_entry():
+    prev = {"nodes": [{"id": "a", "group": "s1"}], "edges": []}
+    cur = {"nodes": [{"id": "a", "group": "s1"}, {"id": "a", "group": "s2"}], "edges": []}
+    full = scan_drift.diff_graphs(prev, cur, 0.1)
+    assert full["summary"]["added_nodes_count"] == 0
+    assert restricted_diff(prev, cur)["summary"] == full["summary"]
+
+
+def test_fingerprint_accepts_mixed_ids_and_null_types():
+    graph = {"nodes": [{"id": 1}, {"id": "1"}, {"id": "b", "group": 3}],
+             "edges": [{"from": 1, "to": "b", "type": None}, {"from": 1, "to": "b", "type": "import"}]}
+    fp = scan_drift.fingerprint(graph)
+    assert fp["groups"][""]["edges"] == 2
+    assert fp == scan_drift.fingerprint(json.loads(json.dumps(graph)))
+
+
+def test_stale_stamp_on_current_does_not_hide_drift(tmp_path):
+    prev = {"nodes": [{"id": "a"}, {"id": "b"}], "edges": [{"from": "a", "to": "b"}]}
+    prev_path, cur_path, out = tmp_path / "prev.json", tmp_path / "cur.json", tmp_path / "out.json"
+    prev_path.write_text(json.dumps(prev))
+    cur_path.write_text(json.dumps(prev))
+    scan_drift.main(["--current", str(cur_path), "--previous", str(prev_path), "--out", str(out), "--stamp"])
+
+    stamped = json.loads(cur_path.read_text())
+    stamped["edges"] += [{"from": "b", "to": "a"}, {"from": "a", "to": "a"}]
+    cur_path.write_text(json.dumps(stamped))
+    with pytest.raises(SystemExit) as exc:
+        scan_drift.main(["--current", str(cur_path), "--previous", str(prev_path), "--out", str(out)])
+    assert exc.value.code == 2
+    assert json.loads(out.read_text())["summary"]["added_edges_count"] == 2
+
+
+def test_canonical_dedupes_and_rejects_embedded_separators():
+    base = {"nodes": [{"id": "a"}, {"id": "b"}], "edges": [{"from": "a", "to": "b", "type": "x"}]}
+    dup = copy.deepcopy(base)
+    dup["edges"].append(dict(dup["edges"][0]))
+    assert scan_drift.fingerprint(dup) == scan_drift.fingerprint(base)
+    assert scan_drift.fingerprint(dup)["groups"][""]["edges"] == 1
+
+    # "a\0b" joined with "c" must not collide with "a" joined with "b\0c".
+    left = {"nodes": [], "edges": [{"from": "a\0b", "to": "c", "type": ""}]}
+    right = {"nodes": [], "edges": [{"from": "a", "to": "b\0c", "type": ""}]}
+    assert scan_drift.fingerprint(left)["root"] != scan_drift.fingerprint(right)["root"]
+
+
+def test_stamped_previous_is_not_parsed_when_nothing_changed(tmp_path):
+    graph = {"meta": {"ref": "r1"}, "nodes": [{"id": "a", "group": "s1"}, {"id": "b", "group": "s2"}],
+             "edges": [{"from": "a", "to": "b", "type": "import"}]}
+    cur, prev, out = tmp_path / "cur.json", tmp_path / "prev.json", tmp_path / "out.json"
+    prev.write_text(json.dumps(graph))
+    scan_drift.main(["--current", str(prev), "--previous", str(prev), "--out", str(out), "--stamp"])
+
+    # Corrupt everything after the header: a no-change run must never reach it.
+    text = prev.read_text()
+    prev.write_text(text[:text.index('"nodes": [')] + '"nodes": <not parsed>')
+    cur.write_text(json.dumps(graph))
+    scan_drift.main(["--current", str(cur), "--previous", str(prev), "--out", str(out)])
+    report = json.loads(out.read_text())
+    assert report["summary"]["previous_ref"] == "r1"
+    assert report["summary"]["churn_ratio"] == 0
+    assert report["fingerprint"]["changed_groups"] == []
+
+
+def test_stamped_previous_diff_matches_unstamped(tmp_path):
+    rng = random.Random(5)
+    for _ in range(20):
+        prev_graph = random_graph(rng)
+        cur_graph = mutate(rng, prev_graph)
+        prev, cur = tmp_path / "prev.json", tmp_path / "cur.json"
+        prev.write_text(json.dumps(prev_graph))
+        cur.write_text(json.dumps(cur_graph))
+        reports = []
+        for stamp in (False, True):
+            if stamp:
+                scan_drift.main(["--current", str(prev), "--previous", str(prev),
+                                 "--out", str(tmp_path / "s.json"), "--stamp"])
+            out = tmp_path / f"out{stamp}.json"
+            try:
+                scan_drift.main(["--current", str(cur), "--previous", str(prev), "--out", str(out)])
+            except SystemExit:
+                pass
+            reports.append(normalized(json.loads(out.read_text())))
+        assert reports[0] == reports[1]